@@ -13,6 +13,7 @@ from langchain_openai import OpenAIEmbeddings
 from models.rag_model import process_resume_and_match_jobs
 from models.rag_model import generate_questions_for_job
 from models.rag_model import provide_feedback
+from models.rag_model import collection_metadata, embed_texts, clear_caches
 
 app = Flask(__name__)
 app.secret_key = 'your_secret_key'
@@ -30,7 +31,7 @@ chroma_client = chromadb.Client()
 
 # Create or get the collection
 collection_name = "company_data"
-collection = chroma_client.get_or_create_collection(collection_name)
+collection = chroma_client.get_or_create_collection(collection_name, metadata=collection_metadata)
 
 # Function to load company data into ChromaDB
 def load_company_data_to_chromadb(file_path):
@@ -43,15 +44,17 @@ def load_company_data_to_chromadb(file_path):
     existing_ids = {metadata["jobTitle"] for metadata in existing_metadatas}
 
     # Insert data into ChromaDB only if it doesn't already exist
-    new_records = 0
-    for _, row in df.iterrows():
-        if row["jobTitle"] not in existing_ids:  # Check if the jobTitle is already in the collection
-            collection.add(
-                documents=[row["jobDescription"]],  # Add the job description as the document
-                metadatas=[{"jobTitle": row["jobTitle"], "jobUrl": row["jobUrl"]}],  # Add metadata
-                ids=[row["jobTitle"]]  # Use jobTitle as a unique identifier
-            )
-            new_records += 1
+    new_rows = df[~df["jobTitle"].isin(existing_ids)].drop_duplicates("jobTitle")  # Check if the jobTitle is already in the collection
+    new_records = len(new_rows)
+    if new_records:
+        job_descriptions = new_rows["jobDescription"].tolist()
+        collection.add(
+            documents=job_descriptions,  # Add the job descriptions as the documents
+            embeddings=embed_texts(job_descriptions),  # Embeddings used for matching
+            metadatas=new_rows[["jobTitle", "jobUrl"]].to_dict("records"),  # Add metadata
+            ids=new_rows["jobTitle"].tolist()  # Use jobTitle as a unique identifier
+        )
+        clear_caches()  # Cached matches were computed against the old job list
 
     print(f"{new_records} new records added to ChromaDB. Skipping duplicates.")
 